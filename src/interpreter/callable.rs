@@ -6,33 +6,13 @@ use crate::error::Result;
 use crate::interpreter::Interpreter;
 use crate::parser::Literal;
 
-pub trait Callable: fmt::Debug + CallableClone {
+pub trait Callable: fmt::Debug {
     fn as_any(&self) -> &dyn Any;
     fn arity(&self) -> usize;
     fn call(&self, interpreter: &mut Interpreter, arguments: Vec<Literal>) -> Result<Literal>;
     fn to_string(&self) -> String;
 }
 
-// Helper trait for object-safe cloning
-pub trait CallableClone {
-    fn clone_box(&self) -> Box<dyn Callable>;
-}
-
-impl<T> CallableClone for T
-where
-    T: 'static + Callable + Clone,
-{
-    fn clone_box(&self) -> Box<dyn Callable> {
-        Box::new(self.clone())
-    }
-}
-
-impl Clone for Box<dyn Callable> {
-    fn clone(&self) -> Box<dyn Callable> {
-        self.clone_box()
-    }
-}
-
 // Native function implementation
 #[derive(Clone)]
 pub struct NativeFunction {
@@ -12,7 +12,11 @@ use crate::parser::Literal;
 pub struct Class {
     pub name: String,
     pub superclass: Option<Rc<Class>>,
-    pub methods: HashMap<String, Function>,
+    /// Every method callable on the class, inherited ones included, with
+    /// overrides taking precedence. Built once when the class is created and
+    /// shared with the copies of the class held by its instances; method
+    /// lookup reads only this table.
+    method_table: Rc<HashMap<String, Function>>,
 }
 
 impl Class {
@@ -21,23 +25,21 @@ impl Class {
         superclass: Option<Rc<Class>>,
         methods: HashMap<String, Function>,
     ) -> Self {
+        let mut method_table = superclass
+            .as_ref()
+            .map(|superclass| (*superclass.method_table).clone())
+            .unwrap_or_default();
+        method_table.extend(methods);
+
         Self {
             name,
             superclass,
-            methods,
+            method_table: Rc::new(method_table),
         }
     }
 
     pub fn find_method(&self, name: &str) -> Option<Function> {
-        if let Some(method) = self.methods.get(name) {
-            return Some(method.clone());
-        }
-
-        if let Some(ref superclass) = self.superclass {
-            return superclass.find_method(name);
-        }
-
-        None
+        self.method_table.get(name).cloned()
     }
 }
 
@@ -94,7 +96,7 @@ impl Instance {
         }
 
         if let Some(method) = self.class.find_method(&name.lexeme) {
-            return Ok(Literal::Callable(Box::new(method.bind(self_ref.clone()))));
+            return Ok(Literal::Callable(Rc::new(method.bind(self_ref.clone()))));
         }
 
         Err(RuntimeError::new(
@@ -47,8 +47,9 @@ impl Environment {
     }
 
     pub fn assign(&mut self, name: &Token, value: Literal) -> Result<()> {
-        if self.values.contains_key(&name.lexeme) {
-            self.values.insert(name.lexeme.clone(), value);
+        // Overwrite the existing slot in place: one hash lookup and no key allocation.
+        if let Some(slot) = self.values.get_mut(&name.lexeme) {
+            *slot = value;
             return Ok(());
         }
 
@@ -76,7 +77,11 @@ impl Environment {
 
     pub fn assign_at(&mut self, distance: usize, name: &Token, value: Literal) -> Result<()> {
         if distance == 0 {
-            self.values.insert(name.lexeme.clone(), value);
+            if let Some(slot) = self.values.get_mut(&name.lexeme) {
+                *slot = value;
+            } else {
+                self.values.insert(name.lexeme.clone(), value);
+            }
             Ok(())
         } else if let Some(enclosing) = &mut self.enclosing {
             enclosing.borrow_mut().assign_at(distance - 1, name, value)
@@ -3,8 +3,8 @@ use std::fmt;
 use std::rc::Rc;
 use std::cell::RefCell;
 
-use crate::error::{InterpreterError, Result};
-use crate::interpreter::{Environment, Interpreter, Callable};
+use crate::error::Result;
+use crate::interpreter::{Environment, Flow, Interpreter, Callable};
 use crate::parser::{Stmt, Literal};
 
 #[derive(Clone)]
@@ -52,36 +52,29 @@ impl Callable for Function {
             Environment::with_enclosing(Rc::clone(&self.closure))
         ));
 
-        // Clone the params and body from the Rc<Stmt> without moving
+        // Borrow the params and body straight out of the shared declaration;
+        // copying the body on every call dominated the cost of small functions.
         let (params, body) = match &*self.declaration {
-            Stmt::Function { params, body, .. } => (params.clone(), body.clone()),
+            Stmt::Function { params, body, .. } => (params, body),
             _ => unreachable!("Function declaration expected"),
         };
 
-        for (i, param) in params.iter().enumerate() {
-            environment
-                .borrow_mut()
-                .define(param.lexeme.clone(), arguments[i].clone());
+        {
+            let mut env = environment.borrow_mut();
+            for (param, argument) in params.iter().zip(arguments) {
+                env.define(param.lexeme.clone(), argument);
+            }
         }
 
-        match interpreter.execute_block(&body, environment) {
-            Ok(()) => {
-                if self.is_initializer {
-                    self.closure.borrow().get_at(0, "this")
-                } else {
-                    Ok(Literal::Nil)
-                }
-            }
-            Err(e) => match e {
-                InterpreterError::Return(value) => {
-                    if self.is_initializer {
-                        self.closure.borrow().get_at(0, "this")
-                    } else {
-                        Ok(value)
-                    }
-                }
-                other_error => Err(other_error),
-            },
+        let flow = interpreter.exec_block(body, environment)?;
+
+        if self.is_initializer {
+            return self.closure.borrow().get_at(0, "this");
+        }
+
+        match flow {
+            Flow::Return(value) => Ok(value),
+            Flow::Normal => Ok(Literal::Nil),
         }
     }
 
@@ -19,11 +19,19 @@ pub use class::{Class, Instance};
 pub use environment::Environment;
 pub use function::Function;
 
+/// How control leaves a statement.
+#[derive(Debug)]
+pub(crate) enum Flow {
+    /// Execution continues with the next statement.
+    Normal,
+    /// A `return` is unwinding to the enclosing function call.
+    Return(Literal),
+}
+
 /// The main interpreter for the Demon language.
 pub struct Interpreter {
     globals: Rc<RefCell<Environment>>,
     environment: Rc<RefCell<Environment>>,
-    locals: std::collections::HashMap<usize, usize>,
 }
 
 impl Default for Interpreter {
@@ -33,7 +41,6 @@ impl Default for Interpreter {
         let interpreter = Self {
             globals: Rc::clone(&globals),
             environment,
-            locals: std::collections::HashMap::new(),
         };
 
         // Add the clock function (kept for backward compatibility)
@@ -48,7 +55,7 @@ impl Default for Interpreter {
 
         interpreter.globals
             .borrow_mut()
-            .define("clock".to_string(), Literal::Callable(Box::new(clock)));
+            .define("clock".to_string(), Literal::Callable(Rc::new(clock)));
 
         interpreter
     }
@@ -65,7 +72,6 @@ impl Interpreter {
         Self {
             globals: Rc::clone(&environment),
             environment,
-            locals: std::collections::HashMap::new(),
         }
     }
 
@@ -78,17 +84,27 @@ impl Interpreter {
     }
 
     /// Executes a single statement.
+    /// A `return` outside of any function is reported as `InterpreterError::Return`.
     pub fn execute(&mut self, stmt: &Stmt) -> Result<()> {
+        match self.exec_stmt(stmt)? {
+            Flow::Normal => Ok(()),
+            Flow::Return(value) => Err(InterpreterError::Return(value)),
+        }
+    }
+
+    /// Executes a single statement, reporting `return` as a `Flow` value
+    /// rather than as an error so function calls unwind without one.
+    pub(crate) fn exec_stmt(&mut self, stmt: &Stmt) -> Result<Flow> {
         match stmt {
-            Stmt::Empty => Ok(()),
+            Stmt::Empty => Ok(Flow::Normal),
             Stmt::Expression(expr) => {
                 self.evaluate(expr)?;
-                Ok(())
+                Ok(Flow::Normal)
             }
             Stmt::Print(expr) => {
                 let value = self.evaluate(expr)?;
                 println!("{}", value);
-                Ok(())
+                Ok(Flow::Normal)
             }
             Stmt::Var { name, initializer } => {
                 let value = if let Some(expr) = initializer {
@@ -100,20 +116,30 @@ impl Interpreter {
                 self.environment
                     .borrow_mut()
                     .define(name.lexeme.clone(), value);
-                Ok(())
+                Ok(Flow::Normal)
             }
             Stmt::Const { name, initializer } => {
                 let value = self.evaluate(initializer)?;
                 self.environment
                     .borrow_mut()
                     .define(name.lexeme.clone(), value);
-                Ok(())
+                Ok(Flow::Normal)
             }
             Stmt::Block(statements) => {
+                // A block that declares nothing can never bind a name in its own
+                // scope, so it runs in the enclosing environment without allocating one.
+                if !declares_names(statements) {
+                    for statement in statements {
+                        if let Flow::Return(value) = self.exec_stmt(statement)? {
+                            return Ok(Flow::Return(value));
+                        }
+                    }
+                    return Ok(Flow::Normal);
+                }
                 let environment = Rc::new(RefCell::new(Environment::with_enclosing(
                     Rc::clone(&self.environment),
                 )));
-                self.execute_block(statements, environment)
+                self.exec_block(statements, environment)
             }
             Stmt::If {
                 condition,
@@ -121,22 +147,24 @@ impl Interpreter {
                 else_branch,
             } => {
                 let condition_value = self.evaluate(condition)?;
-                if self.is_truthy(&condition_value) {
-                    self.execute(then_branch)
+                if condition_value.is_truthy() {
+                    self.exec_stmt(then_branch)
                 } else if let Some(else_branch) = else_branch {
-                    self.execute(else_branch)
+                    self.exec_stmt(else_branch)
                 } else {
-                    Ok(())
+                    Ok(Flow::Normal)
                 }
             }
             Stmt::While { condition, body } => {
                 while {
                     let condition_value = self.evaluate(condition)?;
-                    self.is_truthy(&condition_value)
+                    condition_value.is_truthy()
                 } {
-                    self.execute(body)?;
+                    if let Flow::Return(value) = self.exec_stmt(body)? {
+                        return Ok(Flow::Return(value));
+                    }
                 }
-                Ok(())
+                Ok(Flow::Normal)
             }
             Stmt::Function {
                 name, ..
@@ -148,8 +176,8 @@ impl Interpreter {
                 );
                 self.environment
                     .borrow_mut()
-                    .define(name.lexeme.clone(), Literal::Callable(Box::new(function)));
-                Ok(())
+                    .define(name.lexeme.clone(), Literal::Callable(Rc::new(function)));
+                Ok(Flow::Normal)
             }
             Stmt::Return { value, .. } => {
                 let value = if let Some(expr) = value {
@@ -157,14 +185,16 @@ impl Interpreter {
                 } else {
                     Literal::Nil
                 };
-                Err(InterpreterError::Return(value))
+                Ok(Flow::Return(value))
             }
             Stmt::Class {
                 name,
                 superclass,
                 methods,
-            } => self.visit_class_stmt(name, superclass, methods),
-            
+            } => {
+                self.visit_class_stmt(name, superclass, methods)?;
+                Ok(Flow::Normal)
+            }
         }
     }
 
@@ -174,12 +204,27 @@ impl Interpreter {
         statements: &[Stmt],
         environment: Rc<RefCell<Environment>>,
     ) -> Result<()> {
+        match self.exec_block(statements, environment)? {
+            Flow::Normal => Ok(()),
+            Flow::Return(value) => Err(InterpreterError::Return(value)),
+        }
+    }
+
+    /// Executes a block of statements in a new environment, stopping at the
+    /// first statement that returns.
+    pub(crate) fn exec_block(
+        &mut self,
+        statements: &[Stmt],
+        environment: Rc<RefCell<Environment>>,
+    ) -> Result<Flow> {
         let previous = std::mem::replace(&mut self.environment, environment);
         let result = (|| {
             for statement in statements {
-                self.execute(statement)?;
+                if let Flow::Return(value) = self.exec_stmt(statement)? {
+                    return Ok(Flow::Return(value));
+                }
             }
-            Ok(())
+            Ok(Flow::Normal)
         })();
         self.environment = previous;
         result
@@ -203,7 +248,7 @@ impl Interpreter {
             Expr::Unary { operator, right } => {
                 let right = self.evaluate(right)?;
                 match operator.token_type {
-                    TokenType::Bang => Ok(Literal::Boolean(!self.is_truthy(&right))),
+                    TokenType::Bang => Ok(Literal::Boolean(!right.is_truthy())),
                     TokenType::Minus => {
                         if let Literal::Number(n) = right {
                             Ok(Literal::Number(-n))
@@ -227,52 +272,7 @@ impl Interpreter {
             } => {
                 let left = self.evaluate(left)?;
                 let right = self.evaluate(right)?;
-
-                match (&left, &operator.token_type, &right) {
-                    (Literal::Number(a), TokenType::Plus, Literal::Number(b)) => {
-                        Ok(Literal::Number(a + b))
-                    }
-                    (Literal::String(a), TokenType::Plus, Literal::String(b)) => {
-                        Ok(Literal::String(format!("{}{}", a, b)))
-                    }
-                    (Literal::Number(a), TokenType::Minus, Literal::Number(b)) => {
-                        Ok(Literal::Number(a - b))
-                    }
-                    (Literal::Number(a), TokenType::Star, Literal::Number(b)) => {
-                        Ok(Literal::Number(a * b))
-                    }
-                    (Literal::Number(a), TokenType::Slash, Literal::Number(b)) => {
-                        if *b == 0.0 {
-                            return Err(InterpreterError::Runtime(RuntimeError::new(
-                                operator.clone(),
-                                "Division by zero.".to_string(),
-                            )));
-                        }
-                        Ok(Literal::Number(a / b))
-                    }
-                    (_, TokenType::EqualEqual, _) => {
-                        Ok(Literal::Boolean(self.is_equal(&left, &right)))
-                    }
-                    (_, TokenType::BangEqual, _) => {
-                        Ok(Literal::Boolean(!self.is_equal(&left, &right)))
-                    }
-                    (Literal::Number(a), TokenType::Greater, Literal::Number(b)) => {
-                        Ok(Literal::Boolean(a > b))
-                    }
-                    (Literal::Number(a), TokenType::GreaterEqual, Literal::Number(b)) => {
-                        Ok(Literal::Boolean(a >= b))
-                    }
-                    (Literal::Number(a), TokenType::Less, Literal::Number(b)) => {
-                        Ok(Literal::Boolean(a < b))
-                    }
-                    (Literal::Number(a), TokenType::LessEqual, Literal::Number(b)) => {
-                        Ok(Literal::Boolean(a <= b))
-                    }
-                    _ => Err(InterpreterError::Runtime(RuntimeError::new(
-                        operator.clone(),
-                        "Invalid operands.".to_string(),
-                    ))),
-                }
+                Self::binary_op(operator, left, right)
             }
             Expr::Logical {
                 left,
@@ -283,14 +283,14 @@ impl Interpreter {
 
                 match operator.token_type {
                     TokenType::Or => {
-                        if self.is_truthy(&left) {
+                        if left.is_truthy() {
                             Ok(left)
                         } else {
                             self.evaluate(right)
                         }
                     }
                     TokenType::And => {
-                        if !self.is_truthy(&left) {
+                        if !left.is_truthy() {
                             Ok(left)
                         } else {
                             self.evaluate(right)
@@ -304,7 +304,8 @@ impl Interpreter {
             }
             Expr::Call { callee, arguments, .. } => {
                 let callee = self.evaluate(callee)?;
-                let mut args = Vec::new();
+                // Sized up front: one allocation per call, none for zero-argument calls.
+                let mut args = Vec::with_capacity(arguments.len());
 
                 for arg in arguments {
                     args.push(self.evaluate(arg)?);
@@ -353,13 +354,13 @@ impl Interpreter {
                     .into())
                 }
             },
-            Expr::Variable(name) => self.look_up_variable(name, expr),
+            Expr::Variable(name) => self.look_up_variable(name),
             Expr::Assign { name, value } => {
                 let value = self.evaluate(value)?;
                 self.environment.borrow_mut().assign(name, value.clone())?;
                 Ok(value)
             },
-            Expr::This(keyword) => self.look_up_variable(keyword, expr),
+            Expr::This(keyword) => self.look_up_variable(keyword),
             Expr::Super { keyword, method } => {
                 // This is a temporary solution until we have a resolver.
                 let superclass = self.environment.borrow().get(&Token::new(
@@ -376,7 +377,7 @@ impl Interpreter {
 
                 if let Literal::Class(superclass) = superclass {
                     if let Some(method) = superclass.find_method(&method.lexeme) {
-                        Ok(Literal::Callable(Box::new(method.bind(object))))
+                        Ok(Literal::Callable(Rc::new(method.bind(object))))
                     } else {
                         Err(RuntimeError::new(
                             method.clone(),
@@ -400,6 +401,52 @@ impl Interpreter {
         }
     }
 
+    /// Applies a binary operator to two evaluated operands.
+    /// Number operands are matched first so arithmetic and comparisons take a
+    /// single branch on the operator; string `+` appends to the left operand.
+    fn binary_op(operator: &Token, left: Literal, right: Literal) -> Result<Literal> {
+        match (left, right) {
+            (Literal::Number(a), Literal::Number(b)) => match operator.token_type {
+                TokenType::Plus => Ok(Literal::Number(a + b)),
+                TokenType::Minus => Ok(Literal::Number(a - b)),
+                TokenType::Star => Ok(Literal::Number(a * b)),
+                TokenType::Slash => {
+                    if b == 0.0 {
+                        return Err(InterpreterError::Runtime(RuntimeError::new(
+                            operator.clone(),
+                            "Division by zero.".to_string(),
+                        )));
+                    }
+                    Ok(Literal::Number(a / b))
+                }
+                TokenType::Greater => Ok(Literal::Boolean(a > b)),
+                TokenType::GreaterEqual => Ok(Literal::Boolean(a >= b)),
+                TokenType::Less => Ok(Literal::Boolean(a < b)),
+                TokenType::LessEqual => Ok(Literal::Boolean(a <= b)),
+                TokenType::EqualEqual => Ok(Literal::Boolean(a == b)),
+                TokenType::BangEqual => Ok(Literal::Boolean(a != b)),
+                _ => Err(InterpreterError::Runtime(RuntimeError::new(
+                    operator.clone(),
+                    "Invalid operands.".to_string(),
+                ))),
+            },
+            (Literal::String(mut a), Literal::String(b))
+                if operator.token_type == TokenType::Plus =>
+            {
+                a.push_str(&b);
+                Ok(Literal::String(a))
+            }
+            (left, right) => match operator.token_type {
+                TokenType::EqualEqual => Ok(Literal::Boolean(left.is_equal(&right))),
+                TokenType::BangEqual => Ok(Literal::Boolean(!left.is_equal(&right))),
+                _ => Err(InterpreterError::Runtime(RuntimeError::new(
+                    operator.clone(),
+                    "Invalid operands.".to_string(),
+                ))),
+            },
+        }
+    }
+
     fn visit_class_stmt(
         &mut self,
         name: &Token,
@@ -475,39 +522,26 @@ impl Interpreter {
 
         self.environment
             .borrow_mut()
-            .assign(name, Literal::Callable(Box::new(class)))?;
+            .assign(name, Literal::Callable(Rc::new(class)))?;
         Ok(())
     }
 
-    /// Looks up a variable in the environment.
-    fn look_up_variable(&self, name: &Token, expr: &Expr) -> Result<Literal> {
-        if let Some(distance) = self.locals.get(&(expr as *const _ as usize)) {
-            self.environment.borrow().get_at(*distance, &name.lexeme)
-        } else {
-            // Fallback for global variables if resolver is not used
-            self.environment.borrow().get(name)
-        }
-    }
-
-    /// Checks if a value is truthy.
-    fn is_truthy(&self, value: &Literal) -> bool {
-        match value {
-            Literal::Nil => false,
-            Literal::Boolean(b) => *b,
-            _ => true,
-        }
+    /// Looks up a variable by walking the environment chain.
+    fn look_up_variable(&self, name: &Token) -> Result<Literal> {
+        self.environment.borrow().get(name)
     }
+}
 
-    /// Checks if two values are equal.
-    fn is_equal(&self, a: &Literal, b: &Literal) -> bool {
-        match (a, b) {
-            (Literal::Nil, Literal::Nil) => true,
-            (Literal::Nil, _) => false,
-            (_, Literal::Nil) => false,
-            (Literal::Boolean(a), Literal::Boolean(b)) => a == b,
-            (Literal::Number(a), Literal::Number(b)) => a == b,
-            (Literal::String(a), Literal::String(b)) => a == b,
-            _ => false,
-        }
-    }
+/// Returns true if any statement directly in `statements` introduces a binding.
+///
+/// Blocks for which this is false run in the enclosing environment, so they add
+/// no scope to the chain. A resolver recording `get_at` distances must skip
+/// them the same way, or its depths will be off by one per such block.
+fn declares_names(statements: &[Stmt]) -> bool {
+    statements.iter().any(|statement| {
+        matches!(
+            statement,
+            Stmt::Var { .. } | Stmt::Const { .. } | Stmt::Function { .. } | Stmt::Class { .. }
+        )
+    })
 }
@@ -3,6 +3,9 @@
 use super::token::{Token, TokenType};
 
 /// Scans the source code and produces tokens.
+///
+/// `start` and `current` are byte offsets into `source`, so every step is O(1)
+/// and lexemes can be sliced out directly.
 pub struct Scanner {
     source: String,
     tokens: Vec<Token>,
@@ -35,7 +38,7 @@ impl Scanner {
             String::new(),
             self.line,
         ));
-        self.tokens.clone()
+        std::mem::take(&mut self.tokens)
     }
 
     fn is_at_end(&self) -> bool {
@@ -95,10 +98,12 @@ impl Scanner {
             // Comments
             '/' => {
                 if self.match_char('/') {
-                    // A comment goes until the end of the line
-                    while self.peek() != '\n' && !self.is_at_end() {
-                        self.advance();
-                    }
+                    // A comment goes until the end of the line; jump straight to it
+                    // instead of stepping through the comment one character at a time.
+                    self.current = self.source.as_bytes()[self.current..]
+                        .iter()
+                        .position(|&b| b == b'\n')
+                        .map_or(self.source.len(), |offset| self.current + offset);
                 } else {
                     self.add_token(TokenType::Slash);
                 }
@@ -127,8 +132,20 @@ impl Scanner {
     }
 
     fn advance(&mut self) -> char {
-        self.current += 1;
-        self.source.chars().nth(self.current - 1).unwrap()
+        let c = self.char_at(self.current);
+        self.current += c.len_utf8();
+        c
+    }
+
+    /// Decodes the character starting at byte offset `index`.
+    /// ASCII, which is almost all Demon source, is read straight from the byte.
+    fn char_at(&self, index: usize) -> char {
+        let byte = self.source.as_bytes()[index];
+        if byte.is_ascii() {
+            byte as char
+        } else {
+            self.source[index..].chars().next().unwrap()
+        }
     }
 
     fn add_token(&mut self, token_type: TokenType) {
@@ -137,10 +154,10 @@ impl Scanner {
     }
 
     fn match_char(&mut self, expected: char) -> bool {
-        if self.is_at_end() || self.source.chars().nth(self.current).unwrap() != expected {
+        if self.is_at_end() || self.char_at(self.current) != expected {
             return false;
         }
-        self.current += 1;
+        self.current += expected.len_utf8();
         true
     }
 
@@ -148,15 +165,19 @@ impl Scanner {
         if self.is_at_end() {
             '\0'
         } else {
-            self.source.chars().nth(self.current).unwrap()
+            self.char_at(self.current)
         }
     }
 
     fn peek_next(&self) -> char {
-        if self.current + 1 >= self.source.len() {
+        if self.is_at_end() {
+            return '\0';
+        }
+        let next = self.current + self.peek().len_utf8();
+        if next >= self.source.len() {
             '\0'
         } else {
-            self.source.chars().nth(self.current + 1).unwrap()
+            self.char_at(next)
         }
     }
 
@@ -232,3 +253,31 @@ impl Scanner {
         self.add_token(token_type);
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn scan(source: &str) -> Vec<Token> {
+        Scanner::new(source.to_string()).scan_tokens()
+    }
+
+    #[test]
+    fn test_non_ascii_source() {
+        let tokens = scan("var café = \"héllo wörld\"; // ünïcode comment\nprint café;");
+        assert_eq!(tokens[1].token_type, TokenType::Identifier("café".to_string()));
+        assert_eq!(tokens[3].token_type, TokenType::String("héllo wörld".to_string()));
+        assert_eq!(tokens[5].token_type, TokenType::Print);
+        assert_eq!(tokens[5].line, 2);
+        assert_eq!(tokens[6].lexeme, "café");
+    }
+
+    #[test]
+    fn test_numbers_and_operators() {
+        let tokens = scan("1.5 >= 2 // done");
+        assert_eq!(tokens[0].token_type, TokenType::Number(1.5));
+        assert_eq!(tokens[1].token_type, TokenType::GreaterEqual);
+        assert_eq!(tokens[2].token_type, TokenType::Number(2.0));
+        assert_eq!(tokens[3].token_type, TokenType::Eof);
+    }
+}
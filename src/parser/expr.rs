@@ -138,7 +138,7 @@ pub enum Literal {
     Nil,
 
     /// A callable value (function, method, or class)
-    Callable(Box<dyn Callable>),
+    Callable(Rc<dyn Callable>),
 
     /// A class instance
     Instance(Rc<RefCell<Instance>>),
@@ -287,25 +287,14 @@ impl std::ops::Not for Literal {
 }
 
 impl Literal {
-    /// Returns true if the value is truthy.
+    /// Returns true if the value is truthy: everything except `nil` and `false`.
     pub fn is_truthy(&self) -> bool {
-        match self {
-            Literal::Nil => false,
-            Literal::Boolean(b) => *b,
-            _ => true,
-        }
+        !matches!(self, Literal::Nil | Literal::Boolean(false))
     }
 
-    /// Checks if two values are equal.
+    /// Checks if two values are equal. `nil` equals only `nil`; values of
+    /// different kinds, and callables, instances and collections, are never equal.
     pub fn is_equal(&self, other: &Self) -> bool {
-        match (self, other) {
-            (Literal::Nil, Literal::Nil) => true,
-            (Literal::Nil, _) => false,
-            (_, Literal::Nil) => false,
-            (Literal::Boolean(a), Literal::Boolean(b)) => a == b,
-            (Literal::Number(a), Literal::Number(b)) => a == b,
-            (Literal::String(a), Literal::String(b)) => a == b,
-            _ => false,
-        }
+        self == other
     }
 }
@@ -100,10 +100,13 @@ impl<'a> Parser<'a> {
         while self.match_tokens(operators) {
             let operator = self.previous().clone();
             let right = next_fn(self)?;
-            expr = Expr::Binary {
-                left: Box::new(expr),
-                operator,
-                right: Box::new(right),
+            expr = match fold_binary(&expr, &operator, &right) {
+                Some(folded) => folded,
+                None => Expr::Binary {
+                    left: Box::new(expr),
+                    operator,
+                    right: Box::new(right),
+                },
             };
         }
 
@@ -124,6 +127,14 @@ impl<'a> Parser<'a> {
                 TokenType::Ampersand => Ok(Expr::AddressOf {
                     expression: Box::new(right),
                 }),
+                TokenType::Minus => match literal_token(&right).map(|token| &token.token_type) {
+                    // Fold negative number literals so `-1` is a constant, not an operation.
+                    Some(TokenType::Number(n)) => Ok(number_literal(-n, operator.line)),
+                    _ => Ok(Expr::Unary {
+                        operator,
+                        right: Box::new(right),
+                    }),
+                },
                 _ => Ok(Expr::Unary {
                     operator,
                     right: Box::new(right),
@@ -330,3 +341,73 @@ impl<'a> Parser<'a> {
         })
     }
 }
+
+/// Returns the literal token behind `expr`, looking through parentheses.
+fn literal_token(expr: &Expr) -> Option<&Token> {
+    match expr {
+        Expr::Literal(token) => Some(token),
+        Expr::Grouping(inner) => literal_token(inner),
+        _ => None,
+    }
+}
+
+fn number_literal(value: f64, line: usize) -> Expr {
+    Expr::Literal(Token::new(Number(value), value.to_string(), line))
+}
+
+/// Folds arithmetic on two number literals, or concatenation of two string
+/// literals, into a single literal at parse time. Anything that could fail at
+/// runtime (such as division by zero) is left for the interpreter to report.
+fn fold_binary(left: &Expr, operator: &Token, right: &Expr) -> Option<Expr> {
+    let (left, right) = (literal_token(left)?, literal_token(right)?);
+    match (&left.token_type, &right.token_type) {
+        (Number(a), Number(b)) => {
+            let value = match operator.token_type {
+                Plus => a + b,
+                Minus => a - b,
+                Star => a * b,
+                Slash if *b != 0.0 => a / b,
+                _ => return None,
+            };
+            Some(number_literal(value, left.line))
+        }
+        (TokenType::String(a), TokenType::String(b)) if operator.token_type == Plus => {
+            let value = format!("{}{}", a, b);
+            let lexeme = format!("\"{}\"", value);
+            Some(Expr::Literal(Token::new(TokenType::String(value), lexeme, left.line)))
+        }
+        _ => None,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::lexer::Scanner;
+
+    fn parse_expression(source: &str) -> Expr {
+        let tokens = Scanner::new(source.to_string()).scan_tokens();
+        Parser::new(&tokens).expression().unwrap()
+    }
+
+    fn literal_type(expr: &Expr) -> Option<TokenType> {
+        literal_token(expr).map(|token| token.token_type.clone())
+    }
+
+    #[test]
+    fn test_folds_literal_arithmetic() {
+        assert_eq!(literal_type(&parse_expression("60 * 60")), Some(Number(3600.0)));
+        assert_eq!(literal_type(&parse_expression("(1 + 2) * -4")), Some(Number(-12.0)));
+        assert_eq!(
+            literal_type(&parse_expression("\"ab\" + \"cd\"")),
+            Some(TokenType::String("abcd".to_string()))
+        );
+    }
+
+    #[test]
+    fn test_leaves_non_constant_expressions() {
+        assert!(matches!(parse_expression("1 / 0"), Expr::Binary { .. }));
+        assert!(matches!(parse_expression("x + 1"), Expr::Binary { .. }));
+        assert!(matches!(parse_expression("1 < 2"), Expr::Binary { .. }));
+    }
+}
@@ -1,6 +1,7 @@
 //! Standard library for the Demon programming language.
 
 use std::io;
+use std::rc::Rc;
 use std::time::{SystemTime, UNIX_EPOCH};
 
 use crate::interpreter::{Interpreter, NativeFunction};
@@ -11,123 +12,123 @@ pub fn register_stdlib(interpreter: &mut Interpreter) {
     // I/O functions
     interpreter.globals().borrow_mut().define(
         "print".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("print", usize::MAX, print))),
+        Literal::Callable(Rc::new(NativeFunction::new("print", usize::MAX, print))),
     );
     
     interpreter.globals().borrow_mut().define(
         "input".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("input", 0, input))),
+        Literal::Callable(Rc::new(NativeFunction::new("input", 0, input))),
     );
     
     // Time functions
     interpreter.globals().borrow_mut().define(
         "time".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("time", 0, time))),
+        Literal::Callable(Rc::new(NativeFunction::new("time", 0, time))),
     );
 
     // Type conversion functions
     interpreter.globals().borrow_mut().define(
         "to_string".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("to_string", 1, to_string))),
+        Literal::Callable(Rc::new(NativeFunction::new("to_string", 1, to_string))),
     );
     
     interpreter.globals().borrow_mut().define(
         "to_number".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("to_number", 1, to_number))),
+        Literal::Callable(Rc::new(NativeFunction::new("to_number", 1, to_number))),
     );
     
     interpreter.globals().borrow_mut().define(
         "to_bool".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("to_bool", 1, to_bool))),
+        Literal::Callable(Rc::new(NativeFunction::new("to_bool", 1, to_bool))),
     );
 
     // Math functions
     interpreter.globals().borrow_mut().define(
         "abs".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("abs", 1, abs))),
+        Literal::Callable(Rc::new(NativeFunction::new("abs", 1, abs))),
     );
     
     interpreter.globals().borrow_mut().define(
         "sqrt".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("sqrt", 1, sqrt))),
+        Literal::Callable(Rc::new(NativeFunction::new("sqrt", 1, sqrt))),
     );
     
     interpreter.globals().borrow_mut().define(
         "pow".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("pow", 2, pow))),
+        Literal::Callable(Rc::new(NativeFunction::new("pow", 2, pow))),
     );
 
     // String functions
     interpreter.globals().borrow_mut().define(
         "len".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("len", 1, len))),
+        Literal::Callable(Rc::new(NativeFunction::new("len", 1, len))),
     );
     
     interpreter.globals().borrow_mut().define(
         "substring".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("substring", usize::MAX, substring))),
+        Literal::Callable(Rc::new(NativeFunction::new("substring", usize::MAX, substring))),
     );
 
     // Array functions
     interpreter.globals().borrow_mut().define(
         "array".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("array", usize::MAX, array))),
+        Literal::Callable(Rc::new(NativeFunction::new("array", usize::MAX, array))),
     );
     
     interpreter.globals().borrow_mut().define(
         "push".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("push", 2, push))),
+        Literal::Callable(Rc::new(NativeFunction::new("push", 2, push))),
     );
     
     interpreter.globals().borrow_mut().define(
         "pop".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("pop", 1, pop))),
+        Literal::Callable(Rc::new(NativeFunction::new("pop", 1, pop))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map", 2, map))),
+        Literal::Callable(Rc::new(NativeFunction::new("map", 2, map))),
     );
 
     // Map functions
     interpreter.globals().borrow_mut().define(
         "Map".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("Map", 0, map_new))),
+        Literal::Callable(Rc::new(NativeFunction::new("Map", 0, map_new))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_has".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_has", 2, map_has))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_has", 2, map_has))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_get".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_get", 2, map_get))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_get", 2, map_get))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_set".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_set", 3, map_set))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_set", 3, map_set))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_remove".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_remove", 2, map_remove))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_remove", 2, map_remove))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_keys".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_keys", 1, map_keys))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_keys", 1, map_keys))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_values".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_values", 1, map_values))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_values", 1, map_values))),
     );
     
     interpreter.globals().borrow_mut().define(
         "map_entries".to_string(),
-        Literal::Callable(Box::new(NativeFunction::new("map_entries", 1, map_entries))),
+        Literal::Callable(Rc::new(NativeFunction::new("map_entries", 1, map_entries))),
     );
 }
 
@@ -263,46 +264,51 @@ fn array(_: &mut Interpreter, args: Vec<Literal>) -> Result<Literal> {
 
 /// Adds an element to the end of an array.
 fn push(_: &mut Interpreter, args: Vec<Literal>) -> Result<Literal> {
-    let mut array = match &args[0] {
-        Literal::Array(elements) => elements.clone(),
+    // Take the arguments by value to avoid cloning the array a second time here.
+    // Reading the array out of a variable has already copied it, so `a = push(a, x)`
+    // is still O(n) per call.
+    let mut args = args.into_iter();
+    let mut array = match args.next() {
+        Some(Literal::Array(elements)) => elements,
         _ => return Err(crate::error::general_error("push() first argument must be an array")),
     };
     
-    array.push(args[1].clone());
+    let value = match args.next() {
+        Some(value) => value,
+        None => return Err(crate::error::general_error("push() requires a value to append")),
+    };
+    
+    array.push(value);
     Ok(Literal::Array(array))
 }
 
 /// Removes and returns the last element of an array.
 fn pop(_: &mut Interpreter, args: Vec<Literal>) -> Result<Literal> {
-    let mut array = match &args[0] {
-        Literal::Array(elements) => elements.clone(),
+    let mut array = match args.into_iter().next() {
+        Some(Literal::Array(elements)) => elements,
         _ => return Err(crate::error::general_error("pop() argument must be an array")),
     };
     
-    if array.is_empty() {
-        return Ok(Literal::Nil);
-    }
-    
-    let last = array.pop().unwrap();
-    Ok(last)
+    Ok(array.pop().unwrap_or(Literal::Nil))
 }
 
 /// Applies a function to each element of an array and returns a new array with the results.
 fn map(interpreter: &mut Interpreter, args: Vec<Literal>) -> Result<Literal> {
-    let array = match &args[0] {
-        Literal::Array(elements) => elements,
+    let mut args = args.into_iter();
+    let array = match args.next() {
+        Some(Literal::Array(elements)) => elements,
         _ => return Err(crate::error::general_error("map() first argument must be an array")),
     };
     
-    let func = match &args[1] {
-        Literal::Callable(func) => func,
+    let func = match args.next() {
+        Some(Literal::Callable(func)) => func,
         _ => return Err(crate::error::general_error("map() second argument must be a function")),
     };
     
-    let mut result = Vec::new();
-    for (_i, item) in array.iter().enumerate() {
-        let mapped = func.call(interpreter, vec![item.clone()])?;
-        result.push(mapped);
+    // The array is owned here, so each element is moved into its call rather than cloned.
+    let mut result = Vec::with_capacity(array.len());
+    for item in array {
+        result.push(func.call(interpreter, vec![item])?);
     }
     
     Ok(Literal::Array(result))
@@ -466,4 +472,35 @@ mod tests {
             Literal::Number(8.0)
         );
     }
+    
+    #[test]
+    fn test_array_functions() {
+        let mut interp = Interpreter::default();
+        let numbers = Literal::Array(vec![Literal::Number(1.0), Literal::Number(2.0)]);
+        match push(&mut interp, vec![numbers.clone(), Literal::Number(3.0)]).unwrap() {
+            Literal::Array(elements) => assert_eq!(
+                elements,
+                vec![Literal::Number(1.0), Literal::Number(2.0), Literal::Number(3.0)]
+            ),
+            other => panic!("push() returned {:?}", other),
+        }
+        assert_eq!(pop(&mut interp, vec![numbers]).unwrap(), Literal::Number(2.0));
+        assert_eq!(pop(&mut interp, vec![Literal::Array(Vec::new())]).unwrap(), Literal::Nil);
+        assert!(push(&mut interp, vec![Literal::Nil, Literal::Nil]).is_err());
+        assert!(push(&mut interp, vec![Literal::Array(Vec::new())]).is_err());
+    }
+    
+    #[test]
+    fn test_map() {
+        let mut interp = Interpreter::default();
+        let negated = Literal::Array(vec![Literal::Number(-1.0), Literal::Number(-2.0)]);
+        let abs_fn = Literal::Callable(Rc::new(NativeFunction::new("abs", 1, abs)));
+        match map(&mut interp, vec![negated, abs_fn]).unwrap() {
+            Literal::Array(elements) => {
+                assert_eq!(elements, vec![Literal::Number(1.0), Literal::Number(2.0)])
+            }
+            other => panic!("map() returned {:?}", other),
+        }
+        assert!(map(&mut interp, vec![Literal::Array(Vec::new()), Literal::Nil]).is_err());
+    }
 }